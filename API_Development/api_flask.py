@@ -3,79 +3,417 @@ REST API Example using Flask
 Demonstrates: RESTful API design, HTTP methods, JSON responses, error handling
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request, g
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
-from datetime import datetime
-import json
+from collections import defaultdict
+from dataclasses import dataclass, replace
+from functools import wraps
+from operator import attrgetter
+from bisect import bisect_left, bisect_right, insort
+from datetime import date, datetime, timedelta, timezone
+import orjson
+import numpy as np
+import os
+import threading
+import time
+import zlib
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson (request.json, jsonify)"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)  # Enable CORS for frontend access
 
+@dataclass(slots=True)
+class Employee:
+    """Employee record; orjson serializes it like the equivalent dict"""
+    id: int
+    firstName: str
+    lastName: str
+    email: str
+    department: str
+    salary: float
+    hireDate: str
+
 # In-memory database (in production, use actual database)
 employees_db = [
-    {
-        'id': 1,
-        'firstName': 'Sarah',
-        'lastName': 'Johnson',
-        'email': 'sarah.johnson@company.com',
-        'department': 'IT',
-        'salary': 95000,
-        'hireDate': '2020-01-15'
-    },
-    {
-        'id': 2,
-        'firstName': 'Michael',
-        'lastName': 'Chen',
-        'email': 'michael.chen@company.com',
-        'department': 'IT',
-        'salary': 87000,
-        'hireDate': '2020-03-22'
-    },
-    {
-        'id': 3,
-        'firstName': 'Emily',
-        'lastName': 'Rodriguez',
-        'email': 'emily.rodriguez@company.com',
-        'department': 'HR',
-        'salary': 72000,
-        'hireDate': '2019-07-10'
-    }
+    Employee(
+        id=1,
+        firstName='Sarah',
+        lastName='Johnson',
+        email='sarah.johnson@company.com',
+        department='IT',
+        salary=95000,
+        hireDate='2020-01-15'
+    ),
+    Employee(
+        id=2,
+        firstName='Michael',
+        lastName='Chen',
+        email='michael.chen@company.com',
+        department='IT',
+        salary=87000,
+        hireDate='2020-03-22'
+    ),
+    Employee(
+        id=3,
+        firstName='Emily',
+        lastName='Rodriguez',
+        email='emily.rodriguez@company.com',
+        department='HR',
+        salary=72000,
+        hireDate='2019-07-10'
+    )
 ]
 
+# Indexes kept in sync with employees_db:
+# - idx_by_id: id -> position in employees_db (deletes swap-pop, so
+#   employees_db itself is unordered)
+# - employees_by_id: O(1) lookups by ID; also the ID-ordered view, since IDs
+#   only grow and dicts keep insertion order
+# - employees_by_dept: department -> employees, in ID order
+# - search_text: id -> lowercased (firstName, lastName, email), kept out of the
+#   Employee records so responses need no stripping
+# - search_index: lowercase trigram -> IDs of employees whose name or email contain it
+# - sorted_indexes: field -> sorted list of (value, id) for the sortable fields
+idx_by_id = {emp.id: i for i, emp in enumerate(employees_db)}
+employees_by_id = {emp.id: emp for emp in employees_db}
+employees_by_dept = defaultdict(list)
+for emp in employees_db:
+    employees_by_dept[emp.department].append(emp)
+search_text = {}
+search_index = defaultdict(set)
+sorted_indexes = {
+    field: sorted((getattr(emp, field), emp.id) for emp in employees_db)
+    for field in ('salary', 'hireDate')
+}
+
+# Serializes writes, and reads that walk several indexes, when served by
+# threaded workers (see gunicorn_conf.py)
+db_lock = threading.Lock()
+
+# Cached /api/statistics payload (None until computed or after a write)
+statistics_cache = None
+
+# Bumped on every write; GET ETags are derived from it
+db_version = 0
+
+# Default hireDate: [today's ISO date, time.time() at the next local midnight]
+_today_cache = ['', 0.0]
+
 # Counter for generating new IDs
 next_id = 4
 
+# Validation rules
+REQUIRED_FIELDS = ('firstName', 'lastName', 'email', 'department', 'salary')
+REQUIRED_FIELD_SET = frozenset(REQUIRED_FIELDS)
+EMPLOYEE_FIELDS = ('id',) + REQUIRED_FIELDS + ('hireDate',)
+UPDATABLE_FIELDS = frozenset(EMPLOYEE_FIELDS) - {'id'}
+DEPARTMENT_NAMES = ('IT', 'HR', 'Finance', 'Marketing', 'Operations')
+VALID_DEPARTMENTS = frozenset(DEPARTMENT_NAMES)
+DEPARTMENT_CODES = {name: code for code, name in enumerate(DEPARTMENT_NAMES)}
+DEPARTMENT_ERROR = f"Department must be one of: {', '.join(DEPARTMENT_NAMES)}"
+_MISSING = object()
+
+# Fields matched by /api/employees/search
+SEARCH_FIELDS = ('firstName', 'lastName', 'email')
+
+# Fields that must be JSON strings when present
+STRING_FIELDS = SEARCH_FIELDS + ('department', 'hireDate')
+
 # =============================================
 # Helper Functions
 # =============================================
 
 def find_employee(employee_id):
     """Find employee by ID"""
-    return next((emp for emp in employees_db if emp['id'] == employee_id), None)
+    return employees_by_id.get(employee_id)
+
+def add_to_department_index(employee):
+    """Insert employee into its department bucket, keeping ID order"""
+    bucket = employees_by_dept[employee.department]
+    bucket.append(employee)
+    if len(bucket) > 1 and bucket[-2].id > employee.id:
+        bucket.sort(key=lambda emp: emp.id)
+
+def remove_from_department_index(employee):
+    """Remove employee from its department bucket"""
+    bucket = employees_by_dept[employee.department]
+    bucket.remove(employee)
+    if not bucket:
+        del employees_by_dept[employee.department]
+
+def trigrams(text):
+    """Set of all 3-character substrings of text"""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+def search_entry(employee):
+    """Employee's lowercased search fields and the set of their trigrams"""
+    lowered = tuple(getattr(employee, field).lower() for field in SEARCH_FIELDS)
+    return lowered, set().union(*map(trigrams, lowered))
+
+def add_to_search_index(employee, entry=None):
+    """Cache employee's search entry (built by search_entry) and index its trigrams"""
+    lowered, grams = entry or search_entry(employee)
+    search_text[employee.id] = lowered
+    for gram in grams:
+        search_index[gram].add(employee.id)
+
+def remove_from_search_index(employee):
+    """Drop employee's cached search fields and trigram postings"""
+    lowered = search_text.pop(employee.id)
+    for gram in set().union(*map(trigrams, lowered)):
+        postings = search_index[gram]
+        postings.discard(employee.id)
+        if not postings:
+            del search_index[gram]
+
+def search_candidates(query):
+    """
+    Employees that may match a lowercase query, in ID order.
+    Intersects the trigram posting sets; callers still confirm with a
+    substring check. Queries shorter than a trigram scan the full table.
+    """
+    if len(query) < 3:
+        return employees_by_id.values()
+    postings = sorted((search_index.get(gram, ()) for gram in trigrams(query)), key=len)
+    if not postings[0]:
+        return []
+    ids = set(postings[0]).intersection(*postings[1:])
+    return [employees_by_id[emp_id] for emp_id in sorted(ids)]
+
+def add_to_sorted_indexes(employee):
+    """Insert employee's (value, id) pair into each sorted index"""
+    for field, index in sorted_indexes.items():
+        insort(index, (getattr(employee, field), employee.id))
+
+def remove_from_sorted_indexes(employee):
+    """Remove employee's (value, id) pair from each sorted index"""
+    for field, index in sorted_indexes.items():
+        del index[bisect_left(index, (getattr(employee, field), employee.id))]
+
+def descending(index):
+    """
+    A sorted index's (value, id) pairs by descending value; equal values keep
+    ascending ID order, as a stable sort with reverse=True does
+    """
+    pairs = []
+    hi = len(index)
+    while hi:
+        lo = bisect_left(index, (index[hi - 1][0],))
+        pairs.extend(index[lo:hi])
+        hi = lo
+    return pairs
+
+def employees_in_salary_range(min_salary=None, max_salary=None):
+    """Employees with min_salary <= salary <= max_salary, in ID order"""
+    by_salary = sorted_indexes['salary']
+    lo = 0 if min_salary is None else bisect_left(by_salary, (min_salary,))
+    hi = len(by_salary) if max_salary is None else bisect_right(by_salary, (max_salary, float('inf')))
+    return [employees_by_id[emp_id] for _, emp_id in sorted(by_salary[lo:hi], key=lambda item: item[1])]
+
+def add_employee(employee):
+    """Store a new employee and register it in every index"""
+    # Build the index entries first so a bad record fails before anything changes
+    entry = search_entry(employee)
+    idx_by_id[employee.id] = len(employees_db)
+    employees_db.append(employee)
+    employees_by_id[employee.id] = employee
+    add_to_department_index(employee)
+    add_to_search_index(employee, entry)
+    add_to_sorted_indexes(employee)
+    mark_modified()
+
+def add_employees(employees):
+    """Store a batch of new employees, re-sorting each sorted index once"""
+    # Build every search entry first so a bad record fails before anything changes
+    entries = [search_entry(employee) for employee in employees]
+    for employee, entry in zip(employees, entries):
+        idx_by_id[employee.id] = len(employees_db)
+        employees_db.append(employee)
+        employees_by_id[employee.id] = employee
+        add_to_department_index(employee)
+        add_to_search_index(employee, entry)
+    for field, index in sorted_indexes.items():
+        index.extend((getattr(emp, field), emp.id) for emp in employees)
+        index.sort()
+    mark_modified()
+
+def remove_employee(employee):
+    """Delete an employee and drop it from every index"""
+    # Swap-pop: move the last employee into the freed slot
+    i = idx_by_id.pop(employee.id)
+    last = employees_db.pop()
+    if i < len(employees_db):
+        employees_db[i] = last
+        idx_by_id[last.id] = i
+    del employees_by_id[employee.id]
+    remove_from_department_index(employee)
+    remove_from_search_index(employee)
+    remove_from_sorted_indexes(employee)
+    mark_modified()
+
+for emp in employees_db:
+    add_to_search_index(emp)
+
+def compute_statistics():
+    """Aggregate salary and department statistics over employees_db"""
+    if not employees_db:
+        return {
+            'totalEmployees': 0,
+            'averageSalary': 0,
+            'departmentCounts': {},
+            'salaryRange': {'min': 0, 'max': 0}
+        }
+    
+    # Salaries stay Python numbers: sums, min and max keep their int/float
+    # types in the JSON and cannot overflow. Department codes are a NumPy
+    # column so grouping is one stable argsort
+    salaries = [emp.salary for emp in employees_db]
+    codes = np.array([DEPARTMENT_CODES[emp.department] for emp in employees_db], dtype=np.int8)
+    
+    # Group by department: stable sort by code, then sum each run
+    order = np.argsort(codes, kind='stable')
+    dept_codes, starts, counts = np.unique(codes[order], return_index=True, return_counts=True)
+    ordered = [salaries[i] for i in order.tolist()]
+    ends = [*starts[1:].tolist(), len(ordered)]
+    totals = [sum(ordered[start:end]) for start, end in zip(starts.tolist(), ends)]
+    
+    # Report departments in order of first appearance, as before
+    appearance = np.argsort(order[starts]).tolist()
+    departments = [DEPARTMENT_NAMES[dept_codes[i]] for i in appearance]
+    counts = [counts[i].item() for i in appearance]
+    totals = [totals[i] for i in appearance]
+    
+    return {
+        'totalEmployees': len(employees_db),
+        'averageSalary': sum(salaries) / len(salaries),
+        'departmentCounts': dict(zip(departments, counts)),
+        'salaryRange': {
+            'min': min(salaries),
+            'max': max(salaries)
+        },
+        'departmentStats': [
+            {
+                'department': dept,
+                'count': count,
+                'averageSalary': dept_total / count,
+                'totalPayroll': dept_total
+            }
+            for dept, count, dept_total in zip(departments, counts, totals)
+        ]
+    }
+
+def employee_statistics():
+    """Statistics for /api/statistics, recomputed only after a write"""
+    global statistics_cache
+    # Computing under db_lock keeps a concurrent write from changing
+    # employees_db mid-pass or invalidating the cache before we store it
+    with db_lock:
+        if statistics_cache is None:
+            statistics_cache = compute_statistics()
+        return statistics_cache
+
+def mark_modified():
+    """Record a write: bump db_version and drop cached statistics"""
+    global statistics_cache, db_version
+    statistics_cache = None
+    db_version += 1
+
+def locked(view):
+    """Run an endpoint while holding db_lock (writes, and multi-index reads)"""
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        with db_lock:
+            return view(*args, **kwargs)
+    return wrapper
 
 def validate_employee_data(data, is_update=False):
     """Validate employee data"""
     errors = []
     
-    required_fields = ['firstName', 'lastName', 'email', 'department', 'salary']
+    # Subset check runs in C; messages are only built when a field is missing
+    if not is_update and not REQUIRED_FIELD_SET <= data.keys():
+        errors.extend(f"Missing required field: {field}" for field in REQUIRED_FIELDS if field not in data)
     
-    if not is_update:
-        for field in required_fields:
-            if field not in data:
-                errors.append(f"Missing required field: {field}")
+    # Type checks come first; the value checks below assume strings
+    wrong_type = [field for field in STRING_FIELDS
+                  if field in data and not isinstance(data[field], str)]
+    if wrong_type:
+        errors.extend(f"Field {field} must be a string" for field in wrong_type)
+        return errors
     
-    if 'email' in data and '@' not in data['email']:
+    email = data.get('email', _MISSING)
+    if email is not _MISSING and '@' not in email:
         errors.append("Invalid email format")
     
-    if 'salary' in data and (not isinstance(data['salary'], (int, float)) or data['salary'] < 0):
+    salary = data.get('salary', _MISSING)
+    if salary is not _MISSING and (not isinstance(salary, (int, float)) or
+                                   isinstance(salary, bool) or salary < 0):
         errors.append("Salary must be a positive number")
     
-    valid_departments = ['IT', 'HR', 'Finance', 'Marketing', 'Operations']
-    if 'department' in data and data['department'] not in valid_departments:
-        errors.append(f"Department must be one of: {', '.join(valid_departments)}")
+    department = data.get('department', _MISSING)
+    if department is not _MISSING and department not in VALID_DEPARTMENTS:
+        errors.append(DEPARTMENT_ERROR)
     
     return errors
 
+def today_iso():
+    """Today's local date as YYYY-MM-DD, recomputed only when the day changes"""
+    now = time.time()
+    if now >= _today_cache[1]:
+        today = date.today()
+        midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+        _today_cache[:] = [today.isoformat(), midnight.timestamp()]
+    return _today_cache[0]
+
+def build_employee(employee_id, data):
+    """New employee record from validated request data"""
+    return Employee(
+        id=employee_id,
+        firstName=data['firstName'],
+        lastName=data['lastName'],
+        email=data['email'],
+        department=data['department'],
+        salary=data['salary'],
+        hireDate=data['hireDate'] if 'hireDate' in data else today_iso()
+    )
+
+def request_timestamp():
+    """UTC ISO 8601 timestamp, formatted once per request"""
+    if 'ts' not in g:
+        g.ts = datetime.now(timezone.utc).isoformat(timespec='seconds').replace('+00:00', 'Z')
+    return g.ts
+
+def current_etag():
+    """ETag for the current GET: data version plus a hash of path and query"""
+    return f"{db_version}-{zlib.crc32(request.full_path.encode()):08x}"
+
+def json_response(obj, status_code=200):
+    """Serialize obj with orjson into a JSON response"""
+    return app.response_class(
+        orjson.dumps(obj),
+        status=status_code,
+        mimetype='application/json'
+    )
+
+def project_fields(employees):
+    """Apply the optional ?fields=a,b,c projection to a list of employees"""
+    fields = request.args.get('fields')
+    if not fields:
+        return employees
+    requested = set(fields.split(','))
+    keys = [key for key in EMPLOYEE_FIELDS if key in requested]
+    return [{key: getattr(emp, key) for key in keys} for emp in employees]
+
 def create_response(data=None, message=None, status_code=200):
     """Create standardized API response"""
     response = {}
@@ -87,18 +425,39 @@ def create_response(data=None, message=None, status_code=200):
         response['message'] = message
     
     response['success'] = 200 <= status_code < 300
-    response['timestamp'] = datetime.now().isoformat()
+    response['timestamp'] = request_timestamp()
     
-    return jsonify(response), status_code
+    return json_response(response, status_code)
 
 # =============================================
 # API Endpoints
 # =============================================
 
+@app.before_request
+def cache_request_timestamp():
+    """Compute the response timestamp once at the start of each request"""
+    request_timestamp()
+
+@app.before_request
+def check_etag():
+    """Answer a repeat GET with 304 when nothing was written since"""
+    if request.method == 'GET':
+        g.etag = current_etag()
+        if request.if_none_match.contains_weak(g.etag):
+            return app.response_class(status=304)
+
+@app.after_request
+def add_etag(response):
+    """Tag GET responses so clients can revalidate with If-None-Match"""
+    if 'etag' in g and response.status_code in (200, 304):
+        response.set_etag(g.etag, weak=True)
+        response.headers['Cache-Control'] = 'private, must-revalidate'
+    return response
+
 @app.route('/')
 def home():
     """API Documentation"""
-    return jsonify({
+    return json_response({
         'name': 'Employee Management API',
         'version': '1.0.0',
         'description': 'RESTful API for employee management',
@@ -106,14 +465,19 @@ def home():
             'GET /api/employees': 'Get all employees',
             'GET /api/employees/<id>': 'Get employee by ID',
             'POST /api/employees': 'Create new employee',
+            'POST /api/employees/bulk': 'Create employees from a JSON array',
             'PUT /api/employees/<id>': 'Update employee',
             'DELETE /api/employees/<id>': 'Delete employee',
             'GET /api/employees/department/<dept>': 'Get employees by department',
             'GET /api/statistics': 'Get statistics'
+        },
+        'queryParameters': {
+            'fields': 'Comma-separated fields to return from list endpoints, e.g. ?fields=id,firstName,salary'
         }
     })
 
 @app.route('/api/employees', methods=['GET'])
+@locked
 def get_employees():
     """
     GET /api/employees
@@ -121,30 +485,45 @@ def get_employees():
     - department: Filter by department
     - sort: Sort by field (salary, hireDate)
     - order: Sort order (asc, desc)
+    - fields: Comma-separated fields to return (e.g. id,firstName,salary)
     """
-    employees = employees_db.copy()
-    
-    # Filter by department
     department = request.args.get('department')
-    if department:
-        employees = [emp for emp in employees if emp['department'] == department]
-    
-    # Sort
     sort_by = request.args.get('sort', 'id')
     order = request.args.get('order', 'asc')
     
-    if sort_by in ['salary', 'hireDate', 'id']:
-        employees.sort(
-            key=lambda x: x.get(sort_by, 0),
+    # Unfiltered salary/hireDate listings come straight from the sorted index
+    if not department and sort_by in sorted_indexes:
+        index = sorted_indexes[sort_by]
+        if order == 'desc':
+            index = descending(index)
+        employees = [employees_by_id[emp_id] for _, emp_id in index]
+        return create_response(
+            data=project_fields(employees),
+            message=f"Retrieved {len(employees)} employees"
+        )
+    
+    # Filter by department (via the department index)
+    if department:
+        employees = employees_by_dept.get(department, [])
+    else:
+        employees = list(employees_by_id.values())
+    
+    # Sort into a new list; both sources are already in ID order, so the
+    # default ascending-ID listing needs no sort
+    if sort_by in ['salary', 'hireDate', 'id'] and (sort_by != 'id' or order == 'desc'):
+        employees = sorted(
+            employees,
+            key=attrgetter(sort_by),
             reverse=(order == 'desc')
         )
     
     return create_response(
-        data=employees,
+        data=project_fields(employees),
         message=f"Retrieved {len(employees)} employees"
     )
 
 @app.route('/api/employees/<int:employee_id>', methods=['GET'])
+@locked
 def get_employee(employee_id):
     """GET /api/employees/<id> - Get single employee"""
     employee = find_employee(employee_id)
@@ -158,6 +537,7 @@ def get_employee(employee_id):
     return create_response(data=employee)
 
 @app.route('/api/employees', methods=['POST'])
+@locked
 def create_employee():
     """
     POST /api/employees
@@ -172,6 +552,12 @@ def create_employee():
             status_code=400
         )
     
+    if not isinstance(request.json, dict):
+        return create_response(
+            message="Request body must be a JSON object",
+            status_code=400
+        )
+    
     # Validate data
     errors = validate_employee_data(request.json)
     if errors:
@@ -182,17 +568,9 @@ def create_employee():
         )
     
     # Create new employee
-    new_employee = {
-        'id': next_id,
-        'firstName': request.json['firstName'],
-        'lastName': request.json['lastName'],
-        'email': request.json['email'],
-        'department': request.json['department'],
-        'salary': request.json['salary'],
-        'hireDate': request.json.get('hireDate', datetime.now().strftime('%Y-%m-%d'))
-    }
+    new_employee = build_employee(next_id, request.json)
     
-    employees_db.append(new_employee)
+    add_employee(new_employee)
     next_id += 1
     
     return create_response(
@@ -201,7 +579,53 @@ def create_employee():
         status_code=201
     )
 
+@app.route('/api/employees/bulk', methods=['POST'])
+@locked
+def create_employees_bulk():
+    """
+    POST /api/employees/bulk
+    Create many employees in one request
+    Request body: JSON array of employee objects
+    Valid items are created; invalid ones are reported by array index
+    """
+    global next_id
+    
+    items = request.json
+    if not isinstance(items, list) or not items:
+        return create_response(
+            message="Request body must be a non-empty JSON array",
+            status_code=400
+        )
+    
+    # IDs are claimed only once the whole batch has been stored
+    created = []
+    errors = []
+    for index, item in enumerate(items):
+        item_errors = (validate_employee_data(item) if isinstance(item, dict)
+                       else ["Item must be a JSON object"])
+        if item_errors:
+            errors.append({'index': index, 'errors': item_errors})
+        else:
+            created.append(build_employee(next_id + len(created), item))
+    
+    if not created:
+        return create_response(
+            data={'created': [], 'errors': errors},
+            message="Validation failed",
+            status_code=400
+        )
+    
+    add_employees(created)
+    next_id += len(created)
+    
+    return create_response(
+        data={'created': created, 'errors': errors},
+        message=f"Created {len(created)} employees, {len(errors)} failed",
+        status_code=201
+    )
+
 @app.route('/api/employees/<int:employee_id>', methods=['PUT'])
+@locked
 def update_employee(employee_id):
     """PUT /api/employees/<id> - Update employee"""
     employee = find_employee(employee_id)
@@ -218,6 +642,12 @@ def update_employee(employee_id):
             status_code=400
         )
     
+    if not isinstance(request.json, dict):
+        return create_response(
+            message="Request body must be a JSON object",
+            status_code=400
+        )
+    
     # Validate data
     errors = validate_employee_data(request.json, is_update=True)
     if errors:
@@ -227,10 +657,38 @@ def update_employee(employee_id):
             status_code=400
         )
     
-    # Update employee
-    for key, value in request.json.items():
-        if key != 'id':  # Don't allow ID changes
-            employee[key] = value
+    # Update employee. The updated record and its search entry are built first,
+    # so nothing is unindexed if building them fails
+    changes = {key: value for key, value in request.json.items() if key in UPDATABLE_FIELDS}
+    updated = replace(employee, **changes)
+    entry = search_entry(updated)
+    
+    department_changed = request.json.get('department', employee.department) != employee.department
+    search_changed = any(
+        field in request.json and request.json[field] != getattr(employee, field)
+        for field in SEARCH_FIELDS
+    )
+    sorted_changed = any(
+        field in request.json and request.json[field] != getattr(employee, field)
+        for field in sorted_indexes
+    )
+    if department_changed:
+        remove_from_department_index(employee)
+    if search_changed:
+        remove_from_search_index(employee)
+    if sorted_changed:
+        remove_from_sorted_indexes(employee)
+    
+    for key, value in changes.items():  # Known fields only; ID changes aren't allowed
+        setattr(employee, key, value)
+    
+    if department_changed:
+        add_to_department_index(employee)
+    if search_changed:
+        add_to_search_index(employee, entry)
+    if sorted_changed:
+        add_to_sorted_indexes(employee)
+    mark_modified()
     
     return create_response(
         data=employee,
@@ -238,6 +696,7 @@ def update_employee(employee_id):
     )
 
 @app.route('/api/employees/<int:employee_id>', methods=['DELETE'])
+@locked
 def delete_employee(employee_id):
     """DELETE /api/employees/<id> - Delete employee"""
     employee = find_employee(employee_id)
@@ -248,16 +707,17 @@ def delete_employee(employee_id):
             status_code=404
         )
     
-    employees_db.remove(employee)
+    remove_employee(employee)
     
     return create_response(
         message=f"Employee {employee_id} deleted successfully"
     )
 
 @app.route('/api/employees/department/<department>', methods=['GET'])
+@locked
 def get_employees_by_department(department):
     """GET /api/employees/department/<dept> - Get employees by department"""
-    employees = [emp for emp in employees_db if emp['department'] == department]
+    employees = employees_by_dept.get(department, [])
     
     if not employees:
         return create_response(
@@ -266,57 +726,17 @@ def get_employees_by_department(department):
         )
     
     return create_response(
-        data=employees,
+        data=project_fields(employees),
         message=f"Found {len(employees)} employees in {department}"
     )
 
 @app.route('/api/statistics', methods=['GET'])
 def get_statistics():
     """GET /api/statistics - Get employee statistics"""
-    if not employees_db:
-        return create_response(
-            data={
-                'totalEmployees': 0,
-                'averageSalary': 0,
-                'departmentCounts': {},
-                'salaryRange': {'min': 0, 'max': 0}
-            }
-        )
-    
-    # Calculate statistics
-    salaries = [emp['salary'] for emp in employees_db]
-    departments = {}
-    
-    for emp in employees_db:
-        dept = emp['department']
-        departments[dept] = departments.get(dept, 0) + 1
-    
-    statistics = {
-        'totalEmployees': len(employees_db),
-        'averageSalary': sum(salaries) / len(salaries),
-        'departmentCounts': departments,
-        'salaryRange': {
-            'min': min(salaries),
-            'max': max(salaries)
-        },
-        'departmentStats': []
-    }
-    
-    # Department-specific stats
-    for dept in set(emp['department'] for emp in employees_db):
-        dept_employees = [emp for emp in employees_db if emp['department'] == dept]
-        dept_salaries = [emp['salary'] for emp in dept_employees]
-        
-        statistics['departmentStats'].append({
-            'department': dept,
-            'count': len(dept_employees),
-            'averageSalary': sum(dept_salaries) / len(dept_salaries),
-            'totalPayroll': sum(dept_salaries)
-        })
-    
-    return create_response(data=statistics)
+    return create_response(data=employee_statistics())
 
 @app.route('/api/employees/search', methods=['GET'])
+@locked
 def search_employees():
     """
     GET /api/employees/search
@@ -324,31 +744,29 @@ def search_employees():
     - q: Search query (searches name and email)
     - minSalary: Minimum salary
     - maxSalary: Maximum salary
+    - fields: Comma-separated fields to return
     """
     query = request.args.get('q', '').lower()
     min_salary = request.args.get('minSalary', type=float)
     max_salary = request.args.get('maxSalary', type=float)
     
-    results = employees_db.copy()
-    
-    # Text search
+    # Text search: trigram index narrows the candidates, substring check
+    # confirms, and the salary range is checked on those few candidates
     if query:
         results = [
-            emp for emp in results
-            if query in emp['firstName'].lower() or
-               query in emp['lastName'].lower() or
-               query in emp['email'].lower()
+            emp for emp in search_candidates(query)
+            if any(query in text for text in search_text[emp.id]) and
+               (min_salary is None or emp.salary >= min_salary) and
+               (max_salary is None or emp.salary <= max_salary)
         ]
-    
-    # Salary range
-    if min_salary is not None:
-        results = [emp for emp in results if emp['salary'] >= min_salary]
-    
-    if max_salary is not None:
-        results = [emp for emp in results if emp['salary'] <= max_salary]
+    # Salary range alone: binary search on the salary index
+    elif min_salary is not None or max_salary is not None:
+        results = employees_in_salary_range(min_salary, max_salary)
+    else:
+        results = list(employees_by_id.values())
     
     return create_response(
-        data=results,
+        data=project_fields(results),
         message=f"Found {len(results)} employees matching criteria"
     )
 
@@ -390,6 +808,7 @@ if __name__ == '__main__':
     print("=" * 60)
     print("API is running on: http://localhost:5000")
     print("Documentation: http://localhost:5000")
+    print("Production: gunicorn -c gunicorn_conf.py api_flask:app")
     print("=" * 60)
     
-    app.run(debug=True, port=5000)
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', port=5000)
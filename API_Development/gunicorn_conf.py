@@ -0,0 +1,16 @@
+"""
+Gunicorn configuration for the Employee Management API
+Usage: gunicorn -c gunicorn_conf.py api_flask:app
+"""
+
+import multiprocessing
+
+bind = '127.0.0.1:5000'
+
+# employees_db lives in process memory, so one worker process keeps a single
+# consistent store; concurrency comes from threads (writes hold db_lock)
+workers = 1
+worker_class = 'gthread'
+threads = 2 * multiprocessing.cpu_count() + 1
+
+accesslog = '-'
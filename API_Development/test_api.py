@@ -4,6 +4,7 @@ Demonstrates: Testing REST API endpoints, HTTP requests, response validation
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 from pprint import pprint
 
@@ -15,6 +16,9 @@ class APITester:
     
     def __init__(self, base_url):
         self.base_url = base_url
+        # One session reuses keep-alive connections across all test requests
+        self.session = requests.Session()
+        self.session.mount('http://', HTTPAdapter(pool_connections=10, pool_maxsize=10))
         
     def print_response(self, response, title="Response"):
         """Pretty print API response"""
@@ -28,24 +32,23 @@ class APITester:
     def test_get_all_employees(self):
         """Test GET /api/employees"""
         print("\n🧪 Testing: GET all employees")
-        response = requests.get(f"{self.base_url}/employees")
+        response = self.session.get(f"{self.base_url}/employees")
         self.print_response(response, "GET All Employees")
         return response
     
     def test_get_employee_by_id(self, employee_id):
         """Test GET /api/employees/<id>"""
         print(f"\n🧪 Testing: GET employee by ID {employee_id}")
-        response = requests.get(f"{self.base_url}/employees/{employee_id}")
+        response = self.session.get(f"{self.base_url}/employees/{employee_id}")
         self.print_response(response, f"GET Employee ID {employee_id}")
         return response
     
     def test_create_employee(self, employee_data):
         """Test POST /api/employees"""
         print("\n🧪 Testing: POST create new employee")
-        response = requests.post(
+        response = self.session.post(
             f"{self.base_url}/employees",
-            json=employee_data,
-            headers={'Content-Type': 'application/json'}
+            json=employee_data
         )
         self.print_response(response, "POST Create Employee")
         return response
@@ -53,10 +56,9 @@ class APITester:
     def test_update_employee(self, employee_id, update_data):
         """Test PUT /api/employees/<id>"""
         print(f"\n🧪 Testing: PUT update employee {employee_id}")
-        response = requests.put(
+        response = self.session.put(
             f"{self.base_url}/employees/{employee_id}",
-            json=update_data,
-            headers={'Content-Type': 'application/json'}
+            json=update_data
         )
         self.print_response(response, f"PUT Update Employee {employee_id}")
         return response
@@ -64,21 +66,21 @@ class APITester:
     def test_delete_employee(self, employee_id):
         """Test DELETE /api/employees/<id>"""
         print(f"\n🧪 Testing: DELETE employee {employee_id}")
-        response = requests.delete(f"{self.base_url}/employees/{employee_id}")
+        response = self.session.delete(f"{self.base_url}/employees/{employee_id}")
         self.print_response(response, f"DELETE Employee {employee_id}")
         return response
     
     def test_get_by_department(self, department):
         """Test GET /api/employees/department/<dept>"""
         print(f"\n🧪 Testing: GET employees in {department}")
-        response = requests.get(f"{self.base_url}/employees/department/{department}")
+        response = self.session.get(f"{self.base_url}/employees/department/{department}")
         self.print_response(response, f"GET Employees in {department}")
         return response
     
     def test_get_statistics(self):
         """Test GET /api/statistics"""
         print("\n🧪 Testing: GET statistics")
-        response = requests.get(f"{self.base_url}/statistics")
+        response = self.session.get(f"{self.base_url}/statistics")
         self.print_response(response, "GET Statistics")
         return response
     
@@ -91,7 +93,7 @@ class APITester:
         if max_salary:
             params['maxSalary'] = max_salary
         
-        response = requests.get(f"{self.base_url}/employees/search", params=params)
+        response = self.session.get(f"{self.base_url}/employees/search", params=params)
         self.print_response(response, "SEARCH Employees")
         return response
     
@@ -103,7 +105,7 @@ class APITester:
             'sort': 'salary',
             'order': 'desc'
         }
-        response = requests.get(f"{self.base_url}/employees", params=params)
+        response = self.session.get(f"{self.base_url}/employees", params=params)
         self.print_response(response, "GET Filtered & Sorted Employees")
         return response
 
@@ -42,46 +42,54 @@ print("\n" + "=" * 60)
 print("2. FACTORY PATTERN - Object Creation")
 print("=" * 60)
 
-from abc import ABC, abstractmethod
-
-class Notification(ABC):
-    """Abstract product"""
+class Notification:
+    """Product interface (duck-typed: anything with send() works)"""
+    
+    __slots__ = ()
     
-    @abstractmethod
     def send(self, message):
-        pass
+        raise NotImplementedError
 
 class EmailNotification(Notification):
     """Concrete product: Email"""
     
+    __slots__ = ()
+    
     def send(self, message):
         return f"📧 Email sent: {message}"
 
 class SMSNotification(Notification):
     """Concrete product: SMS"""
     
+    __slots__ = ()
+    
     def send(self, message):
         return f"📱 SMS sent: {message}"
 
 class PushNotification(Notification):
     """Concrete product: Push"""
     
+    __slots__ = ()
+    
     def send(self, message):
         return f"🔔 Push notification sent: {message}"
 
+# Factory registry: notification type -> product class
+_NOTIFIERS = {
+    'email': EmailNotification,
+    'sms': SMSNotification,
+    'push': PushNotification
+}
+
 class NotificationFactory:
     """Factory: Creates notification objects"""
     
     @staticmethod
     def create_notification(notification_type):
         """Factory method"""
-        notifications = {
-            'email': EmailNotification,
-            'sms': SMSNotification,
-            'push': PushNotification
-        }
-        
-        notification_class = notifications.get(notification_type.lower())
+        # Exact match first; only lowercase when the type isn't already a key
+        notification_class = (_NOTIFIERS.get(notification_type) or
+                              _NOTIFIERS.get(notification_type.lower()))
         if notification_class:
             return notification_class()
         raise ValueError(f"Unknown notification type: {notification_type}")
@@ -101,23 +109,29 @@ print("=" * 60)
 class Subject:
     """Subject that observers watch"""
     
+    __slots__ = ('_observers', '_callbacks', '_state')
+    
     def __init__(self):
         self._observers = []
+        self._callbacks = []  # Bound observer.update methods, parallel to _observers
         self._state = None
     
     def attach(self, observer):
         """Add observer"""
         if observer not in self._observers:
             self._observers.append(observer)
+            self._callbacks.append(observer.update)
     
     def detach(self, observer):
         """Remove observer"""
-        self._observers.remove(observer)
+        i = self._observers.index(observer)
+        del self._observers[i]
+        del self._callbacks[i]
     
     def notify(self):
         """Notify all observers"""
-        for observer in self._observers:
-            observer.update(self)
+        for callback in self._callbacks:
+            callback(self)
     
     @property
     def state(self):
@@ -128,28 +142,35 @@ class Subject:
         self._state = value
         self.notify()
 
-class Observer(ABC):
-    """Abstract observer"""
+class Observer:
+    """Observer interface (duck-typed: anything with update() works)"""
+    
+    __slots__ = ()
     
-    @abstractmethod
     def update(self, subject):
-        pass
+        raise NotImplementedError
 
 class EmailAlert(Observer):
     """Concrete observer: Email alerts"""
     
+    __slots__ = ()
+    
     def update(self, subject):
         print(f"  📧 Email Alert: State changed to {subject.state}")
 
 class SMSAlert(Observer):
     """Concrete observer: SMS alerts"""
     
+    __slots__ = ()
+    
     def update(self, subject):
         print(f"  📱 SMS Alert: State changed to {subject.state}")
 
 class LogAlert(Observer):
     """Concrete observer: Logging"""
     
+    __slots__ = ()
+    
     def update(self, subject):
         print(f"  📝 Log: State changed to {subject.state}")
 
@@ -179,16 +200,19 @@ print("\n" + "=" * 60)
 print("4. STRATEGY PATTERN - Interchangeable Algorithms")
 print("=" * 60)
 
-class PaymentStrategy(ABC):
-    """Abstract strategy"""
+class PaymentStrategy:
+    """Strategy interface (duck-typed: anything with pay() works)"""
+    
+    __slots__ = ()
     
-    @abstractmethod
     def pay(self, amount):
-        pass
+        raise NotImplementedError
 
 class CreditCardPayment(PaymentStrategy):
     """Concrete strategy: Credit Card"""
     
+    __slots__ = ('card_number',)
+    
     def __init__(self, card_number):
         self.card_number = card_number
     
@@ -198,6 +222,8 @@ class CreditCardPayment(PaymentStrategy):
 class PayPalPayment(PaymentStrategy):
     """Concrete strategy: PayPal"""
     
+    __slots__ = ('email',)
+    
     def __init__(self, email):
         self.email = email
     
@@ -207,6 +233,8 @@ class PayPalPayment(PaymentStrategy):
 class CryptoPayment(PaymentStrategy):
     """Concrete strategy: Cryptocurrency"""
     
+    __slots__ = ('wallet_address',)
+    
     def __init__(self, wallet_address):
         self.wallet_address = wallet_address
     
@@ -263,20 +291,22 @@ print("\n" + "=" * 60)
 print("5. DECORATOR PATTERN - Adding Functionality")
 print("=" * 60)
 
-class Coffee(ABC):
-    """Abstract component"""
+class Coffee:
+    """Component interface (duck-typed: get_cost() and get_description())"""
+    
+    __slots__ = ()
     
-    @abstractmethod
     def get_cost(self):
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_description(self):
-        pass
+        raise NotImplementedError
 
 class SimpleCoffee(Coffee):
     """Concrete component"""
     
+    __slots__ = ()
+    
     def get_cost(self):
         return 2.00
     
@@ -284,43 +314,47 @@ class SimpleCoffee(Coffee):
         return "Simple Coffee"
 
 class CoffeeDecorator(Coffee):
-    """Base decorator"""
+    """Base decorator: folds its extra cost and description in once, at construction"""
+    
+    __slots__ = ('_coffee', '_cost', '_description')
+    
+    extra_cost = 0.0
+    extra_description = ""
     
     def __init__(self, coffee):
         self._coffee = coffee
+        self._cost = coffee.get_cost() + self.extra_cost
+        self._description = coffee.get_description() + self.extra_description
     
     def get_cost(self):
-        return self._coffee.get_cost()
+        return self._cost
     
     def get_description(self):
-        return self._coffee.get_description()
+        return self._description
 
 class MilkDecorator(CoffeeDecorator):
     """Concrete decorator: Milk"""
     
-    def get_cost(self):
-        return self._coffee.get_cost() + 0.50
+    __slots__ = ()
     
-    def get_description(self):
-        return self._coffee.get_description() + ", Milk"
+    extra_cost = 0.50
+    extra_description = ", Milk"
 
 class SugarDecorator(CoffeeDecorator):
     """Concrete decorator: Sugar"""
     
-    def get_cost(self):
-        return self._coffee.get_cost() + 0.25
+    __slots__ = ()
     
-    def get_description(self):
-        return self._coffee.get_description() + ", Sugar"
+    extra_cost = 0.25
+    extra_description = ", Sugar"
 
 class WhippedCreamDecorator(CoffeeDecorator):
     """Concrete decorator: Whipped Cream"""
     
-    def get_cost(self):
-        return self._coffee.get_cost() + 0.75
+    __slots__ = ()
     
-    def get_description(self):
-        return self._coffee.get_description() + ", Whipped Cream"
+    extra_cost = 0.75
+    extra_description = ", Whipped Cream"
 
 # Using decorator pattern
 print("\nBuilding custom coffee:")
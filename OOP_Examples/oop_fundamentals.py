@@ -3,30 +3,58 @@ Object-Oriented Programming Fundamentals
 Demonstrates: Classes, Objects, Encapsulation, Inheritance, Polymorphism, Abstraction
 """
 
+from calendar import isleap as _isleap
+from dataclasses import dataclass
+from math import pi, sqrt
+from random import randint
+
 # ===== 1. CLASSES AND OBJECTS =====
 print("=" * 60)
 print("1. CLASSES AND OBJECTS")
 print("=" * 60)
 
+# Number of employees created; also hands out employee IDs
+_employee_count = 0
+
+# Pre-bound str.format methods used by __str__ (C calls, no f-string bytecode)
+_EMPLOYEE_FMT = "{0} - ${1:,}".format
+_ACCOUNT_FMT = "Account {0}: ${1:,.2f}".format
+
 class Employee:
     """
     Basic class demonstrating class and instance attributes
     """
+    
+    __slots__ = ('employee_id', 'first_name', 'last_name', 'full_name', 'salary')
+    
     # Class attribute (shared by all instances)
     company_name = "TechCorp Inc."
-    employee_count = 0
     
     def __init__(self, first_name, last_name, salary):
         """Initialize employee instance"""
+        global _employee_count
         # Instance attributes (unique to each object)
         self.first_name = first_name
         self.last_name = last_name
+        self.full_name = f"{first_name} {last_name}"  # Cached; see rename()
         self.salary = salary
-        Employee.employee_count += 1
+        _employee_count += 1
+        self.employee_id = _employee_count
+    
+    @classmethod
+    def count(cls):
+        """Number of employees created so far"""
+        return _employee_count
     
     def get_full_name(self):
         """Return full name"""
-        return f"{self.first_name} {self.last_name}"
+        return self.full_name
+    
+    def rename(self, first_name, last_name):
+        """Change the name, keeping the cached full name in sync"""
+        self.first_name = first_name
+        self.last_name = last_name
+        self.full_name = f"{first_name} {last_name}"
     
     def give_raise(self, amount):
         """Increase salary"""
@@ -35,7 +63,7 @@ class Employee:
     
     def __str__(self):
         """String representation"""
-        return f"{self.get_full_name()} - ${self.salary:,}"
+        return _EMPLOYEE_FMT(self.full_name, self.salary)
     
     def __repr__(self):
         """Developer-friendly representation"""
@@ -45,7 +73,7 @@ class Employee:
 emp1 = Employee("Alice", "Johnson", 75000)
 emp2 = Employee("Bob", "Smith", 82000)
 
-print(f"\nCreated {Employee.employee_count} employees")
+print(f"\nCreated {Employee.count()} employees")
 print(f"Employee 1: {emp1}")
 print(f"Employee 2: {emp2}")
 
@@ -60,52 +88,48 @@ print("=" * 60)
 
 class BankAccount:
     """
-    Demonstrates encapsulation with private attributes
+    Demonstrates encapsulation with public, protected and private attributes
     """
     
+    __slots__ = ('account_holder', '__account_number', 'balance')
+    
     def __init__(self, account_holder, initial_balance=0):
         self.account_holder = account_holder  # Public
-        self._account_number = self._generate_account_number()  # Protected
-        self.__balance = initial_balance  # Private
+        self.__account_number = self._generate_account_number()  # Private
+        self.balance = initial_balance  # Public read; change via the methods below
     
     def _generate_account_number(self):
         """Protected method - meant for internal use"""
-        import random
-        return f"ACC{random.randint(10000, 99999)}"
+        return f"ACC{randint(10000, 99999)}"
     
     def deposit(self, amount):
         """Public method to deposit money"""
-        if amount > 0:
-            self.__balance += amount
-            return True
-        return False
+        if amount <= 0:
+            return False
+        self.balance += amount
+        return True
     
     def withdraw(self, amount):
         """Public method to withdraw money"""
-        if 0 < amount <= self.__balance:
-            self.__balance -= amount
-            return True
-        return False
+        balance = self.balance
+        if not 0 < amount <= balance:
+            return False
+        self.balance = balance - amount
+        return True
     
     def get_balance(self):
-        """Getter for private balance"""
-        return self.__balance
-    
-    @property
-    def balance(self):
-        """Property decorator for controlled access"""
-        return self.__balance
+        """Getter for balance"""
+        return self.balance
     
-    @balance.setter
-    def balance(self, value):
+    def set_balance(self, value):
         """Setter with validation"""
         if value >= 0:
-            self.__balance = value
+            self.balance = value
         else:
             raise ValueError("Balance cannot be negative")
     
     def __str__(self):
-        return f"Account {self._account_number}: ${self.__balance:,.2f}"
+        return _ACCOUNT_FMT(self.__account_number, self.balance)
 
 account = BankAccount("Alice Johnson", 1000)
 print(f"\nInitial: {account}")
@@ -116,8 +140,8 @@ print(f"After deposit: {account}")
 account.withdraw(200)
 print(f"After withdrawal: {account}")
 
-# Using property
-print(f"Balance (via property): ${account.balance:,.2f}")
+# Reading the balance is a plain slot access
+print(f"Balance (via attribute): ${account.balance:,.2f}")
 
 
 # ===== 3. INHERITANCE =====
@@ -128,6 +152,8 @@ print("=" * 60)
 class Person:
     """Base class"""
     
+    __slots__ = ('name', 'age')
+    
     def __init__(self, name, age):
         self.name = name
         self.age = age
@@ -141,14 +167,21 @@ class Person:
 class Developer(Person):
     """Derived class inheriting from Person"""
     
+    __slots__ = ('programming_languages', '_langs_joined')
+    
     def __init__(self, name, age, programming_languages):
         super().__init__(name, age)  # Call parent constructor
-        self.programming_languages = programming_languages
+        self.programming_languages = tuple(programming_languages)
+        self._langs_joined = ', '.join(self.programming_languages)
+    
+    def add_language(self, language):
+        """Learn another language, refreshing the cached list"""
+        self.programming_languages += (language,)
+        self._langs_joined = ', '.join(self.programming_languages)
     
     def code(self):
         """Method specific to Developer"""
-        langs = ', '.join(self.programming_languages)
-        return f"{self.name} codes in: {langs}"
+        return f"{self.name} codes in: {self._langs_joined}"
     
     def work(self):
         """Override parent method"""
@@ -157,6 +190,8 @@ class Developer(Person):
 class Manager(Person):
     """Another derived class"""
     
+    __slots__ = ('team_size',)
+    
     def __init__(self, name, age, team_size):
         super().__init__(name, age)
         self.team_size = team_size
@@ -189,6 +224,8 @@ print("=" * 60)
 class Shape:
     """Base class for shapes"""
     
+    __slots__ = ()
+    
     def area(self):
         """To be overridden by subclasses"""
         raise NotImplementedError("Subclass must implement area()")
@@ -198,6 +235,8 @@ class Shape:
         raise NotImplementedError("Subclass must implement perimeter()")
 
 class Rectangle(Shape):
+    __slots__ = ('width', 'height')
+    
     def __init__(self, width, height):
         self.width = width
         self.height = height
@@ -212,33 +251,39 @@ class Rectangle(Shape):
         return f"Rectangle({self.width}x{self.height})"
 
 class Circle(Shape):
+    __slots__ = ('radius',)
+    
     def __init__(self, radius):
         self.radius = radius
     
     def area(self):
-        import math
-        return math.pi * self.radius ** 2
+        r = self.radius
+        return pi * (r * r)
     
     def perimeter(self):
-        import math
-        return 2 * math.pi * self.radius
+        return 2 * pi * self.radius
     
     def __str__(self):
         return f"Circle(r={self.radius})"
 
 class Triangle(Shape):
+    __slots__ = ('a', 'b', 'c', '_perimeter', '_s')
+    
     def __init__(self, a, b, c):
         self.a = a
         self.b = b
         self.c = c
+        # Sides are fixed after construction, so compute the perimeter once
+        self._perimeter = a + b + c
+        self._s = self._perimeter * 0.5
     
     def area(self):
         # Heron's formula
-        s = self.perimeter() / 2
-        return (s * (s - self.a) * (s - self.b) * (s - self.c)) ** 0.5
+        s = self._s
+        return sqrt(s * (s - self.a) * (s - self.b) * (s - self.c))
     
     def perimeter(self):
-        return self.a + self.b + self.c
+        return self._perimeter
     
     def __str__(self):
         return f"Triangle({self.a}, {self.b}, {self.c})"
@@ -267,6 +312,21 @@ from abc import ABC, abstractmethod
 class Vehicle(ABC):
     """Abstract base class - cannot be instantiated"""
     
+    __slots__ = ('brand', 'model')
+    
+    # Concrete class -> its start_engine, resolved once per subclass
+    _start_dispatch = {}
+    
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        Vehicle._start_dispatch[cls] = cls.start_engine
+    
+    @classmethod
+    def start_all(cls, vehicles):
+        """Start many vehicles via the dispatch table (no per-call MRO lookup)"""
+        dispatch = cls._start_dispatch
+        return [dispatch[type(vehicle)](vehicle) for vehicle in vehicles]
+    
     def __init__(self, brand, model):
         self.brand = brand
         self.model = model
@@ -288,6 +348,8 @@ class Vehicle(ABC):
 class Car(Vehicle):
     """Concrete implementation of Vehicle"""
     
+    __slots__ = ('num_doors',)
+    
     def __init__(self, brand, model, num_doors):
         super().__init__(brand, model)
         self.num_doors = num_doors
@@ -301,6 +363,8 @@ class Car(Vehicle):
 class Motorcycle(Vehicle):
     """Another concrete implementation"""
     
+    __slots__ = ('engine_cc',)
+    
     def __init__(self, brand, model, engine_cc):
         super().__init__(brand, model)
         self.engine_cc = engine_cc
@@ -323,6 +387,10 @@ for vehicle in vehicles:
     print(f"  {vehicle.start_engine()}")
     print(f"  {vehicle.stop_engine()}")
 
+print("\nStarting the whole fleet:")
+for message in Vehicle.start_all(vehicles):
+    print(f"  {message}")
+
 
 # ===== 6. MULTIPLE INHERITANCE =====
 print("\n" + "=" * 60)
@@ -332,18 +400,24 @@ print("=" * 60)
 class Flyable:
     """Mixin for flying capability"""
     
+    __slots__ = ()
+    
     def fly(self):
         return "Flying in the air ✈️"
 
 class Swimmable:
     """Mixin for swimming capability"""
     
+    __slots__ = ()
+    
     def swim(self):
         return "Swimming in water 🏊"
 
 class Duck(Flyable, Swimmable):
     """Duck can both fly and swim"""
     
+    __slots__ = ('name',)
+    
     def __init__(self, name):
         self.name = name
     
@@ -353,6 +427,8 @@ class Duck(Flyable, Swimmable):
 class Penguin(Swimmable):
     """Penguin can only swim"""
     
+    __slots__ = ('name',)
+    
     def __init__(self, name):
         self.name = name
     
@@ -380,6 +456,8 @@ print("=" * 60)
 class Date:
     """Demonstrates class methods and static methods"""
     
+    __slots__ = ('year', 'month', 'day')
+    
     def __init__(self, year, month, day):
         self.year = year
         self.month = month
@@ -391,10 +469,8 @@ class Date:
         year, month, day = map(int, date_string.split('-'))
         return cls(year, month, day)
     
-    @staticmethod
-    def is_leap_year(year):
-        """Static method - doesn't need instance or class"""
-        return year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    # Static method - doesn't need instance or class (stdlib leap-year rule)
+    is_leap_year = staticmethod(_isleap)
     
     def __str__(self):
         return f"{self.year}-{self.month:02d}-{self.day:02d}"
@@ -417,12 +493,12 @@ print("\n" + "=" * 60)
 print("8. COMPOSITION - HAS-A RELATIONSHIP")
 print("=" * 60)
 
+@dataclass(slots=True, frozen=True)
 class Engine:
-    """Component class"""
+    """Component class (immutable value object)"""
     
-    def __init__(self, horsepower, fuel_type):
-        self.horsepower = horsepower
-        self.fuel_type = fuel_type
+    horsepower: int
+    fuel_type: str
     
     def start(self):
         return f"Starting {self.horsepower}HP {self.fuel_type} engine"
@@ -433,12 +509,16 @@ class Engine:
 class GPS:
     """Another component class"""
     
+    __slots__ = ()
+    
     def get_route(self, destination):
         return f"Calculating route to {destination}"
 
 class AutoCar:
     """Composition: Car HAS-A engine and GPS"""
     
+    __slots__ = ('brand', 'model', 'engine', 'gps')
+    
     def __init__(self, brand, model, engine, gps=None):
         self.brand = brand
         self.model = model
@@ -5,7 +5,20 @@ Demonstrates: Single Responsibility, Open/Closed, Liskov Substitution,
 """
 
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass
+from math import pi
+from operator import methodcaller
+from typing import List, Protocol
+
+try:
+    import numpy as np  # Optional: batched shape areas
+except ImportError:
+    np = None
+
+try:
+    import cupy as cp  # Optional: GPU-resident shape batches
+except ImportError:
+    cp = None
 
 # ===== 1. SINGLE RESPONSIBILITY PRINCIPLE (SRP) =====
 print("=" * 60)
@@ -34,12 +47,12 @@ class BadEmployee:
         return f"Employee Report: {self.name}"
 
 # ✅ GOOD: Separate responsibilities
+@dataclass(slots=True, frozen=True)
 class Employee:
     """Only handles employee data"""
     
-    def __init__(self, name, salary):
-        self.name = name
-        self.salary = salary
+    name: str
+    salary: int
     
     def calculate_pay(self):
         return self.salary
@@ -87,20 +100,20 @@ class BadAreaCalculator:
             if shape['type'] == 'rectangle':
                 total_area += shape['width'] * shape['height']
             elif shape['type'] == 'circle':
-                import math
-                total_area += math.pi * shape['radius'] ** 2
+                total_area += pi * (shape['radius'] * shape['radius'])
             # Need to add elif for every new shape!
         return total_area
 
 # ✅ GOOD: Extensible without modification
-class Shape(ABC):
-    """Abstract base class"""
+class Shape(Protocol):
+    """Structural interface: any class with area() is a Shape, no inheritance needed"""
     
-    @abstractmethod
-    def area(self):
-        pass
+    def area(self) -> float:
+        ...
 
-class Rectangle(Shape):
+class Rectangle:
+    __slots__ = ('width', 'height')
+    
     def __init__(self, width, height):
         self.width = width
         self.height = height
@@ -108,15 +121,19 @@ class Rectangle(Shape):
     def area(self):
         return self.width * self.height
 
-class Circle(Shape):
+class Circle:
+    __slots__ = ('radius',)
+    
     def __init__(self, radius):
         self.radius = radius
     
     def area(self):
-        import math
-        return math.pi * self.radius ** 2
+        r = self.radius
+        return pi * (r * r)
 
-class Triangle(Shape):
+class Triangle:
+    __slots__ = ('base', 'height')
+    
     def __init__(self, base, height):
         self.base = base
         self.height = height
@@ -124,11 +141,78 @@ class Triangle(Shape):
     def area(self):
         return 0.5 * self.base * self.height
 
+class RectangleBatch:
+    """Many rectangles as column arrays (SoA); requires NumPy"""
+    
+    __slots__ = ('widths', 'heights')
+    
+    def __init__(self, widths, heights):
+        self.widths = np.asarray(widths, dtype=np.float32)
+        self.heights = np.asarray(heights, dtype=np.float32)
+    
+    def __len__(self):
+        return len(self.widths)
+    
+    def area_sum(self):
+        # FP32 storage, FP64 accumulator
+        return float(np.multiply(self.widths, self.heights,
+                                 dtype=np.float32).sum(dtype=np.float64))
+
+class CircleBatch:
+    """Many circles as a radius array (SoA); requires NumPy"""
+    
+    __slots__ = ('radii',)
+    
+    def __init__(self, radii):
+        self.radii = np.asarray(radii, dtype=np.float32)
+    
+    def __len__(self):
+        return len(self.radii)
+    
+    def area_sum(self):
+        return float(pi * np.square(self.radii,
+                                    dtype=np.float32).sum(dtype=np.float64))
+
+class CircleBatchGPU(CircleBatch):
+    """CircleBatch held on the GPU with CuPy; plain NumPy CircleBatch without it"""
+    
+    __slots__ = ()
+    
+    def __init__(self, radii):
+        if cp is None:
+            super().__init__(radii)
+        else:
+            self.radii = cp.asarray(radii, dtype=cp.float32)
+    
+    def area_sum(self):
+        if cp is None:
+            return super().area_sum()
+        r = self.radii
+        return float(pi * (r * r).sum(dtype=cp.float64))
+
+# C-level call site for shape.area(); avoids a bound method per shape
+_area = methodcaller('area')
+
+def _sum_rect(rectangles):
+    """Specialized total for all-Rectangle lists: inline width * height, no area() call"""
+    total = 0.0
+    for r in rectangles:
+        total += r.width * r.height
+    return total
+
 class AreaCalculator:
     """No modification needed for new shapes!"""
     
     def calculate_total_area(self, shapes: List[Shape]):
-        return sum(shape.area() for shape in shapes)
+        # Batches sum all their areas in one vectorized pass
+        if hasattr(shapes, 'area_sum'):
+            return shapes.area_sum()
+        # Homogeneous Rectangle lists/tuples take the specialized loop; other
+        # iterables can only be walked once, so they go straight to the sum
+        if (isinstance(shapes, (list, tuple)) and shapes and
+                all(type(shape) is Rectangle for shape in shapes)):
+            return _sum_rect(shapes)
+        return sum(map(_area, shapes))
 
 # Using OCP
 print("\n✅ Good design with OCP:")
@@ -141,6 +225,19 @@ calculator = AreaCalculator()
 total = calculator.calculate_total_area(shapes)
 print(f"Total area: {total:.2f}")
 
+# Large homogeneous collections: store as a batch, sum in NumPy
+if np is not None:
+    rectangles = RectangleBatch(np.full(1000, 5.0), np.full(1000, 4.0))
+    circles = CircleBatch(np.full(1000, 3.0))
+    print(f"Total area of {len(rectangles)} rectangles (batched): "
+          f"{calculator.calculate_total_area(rectangles):.2f}")
+    print(f"Total area of {len(circles)} circles (batched): "
+          f"{calculator.calculate_total_area(circles):.2f}")
+    gpu_circles = CircleBatchGPU(np.full(1000, 3.0))
+    device = "GPU" if cp is not None else "CPU fallback"
+    print(f"Total area of {len(gpu_circles)} circles ({device}): "
+          f"{calculator.calculate_total_area(gpu_circles):.2f}")
+
 
 # ===== 3. LISKOV SUBSTITUTION PRINCIPLE (LSP) =====
 print("\n" + "=" * 60)
@@ -176,11 +273,15 @@ class BadSquare(BadRectangle):
 
 # ✅ GOOD: Follows LSP - use composition instead
 class GoodShape(ABC):
+    __slots__ = ()
+    
     @abstractmethod
     def area(self):
         pass
 
 class GoodRectangle(GoodShape):
+    __slots__ = ('_width', '_height')
+    
     def __init__(self, width, height):
         self._width = width
         self._height = height
@@ -189,11 +290,14 @@ class GoodRectangle(GoodShape):
         return self._width * self._height
 
 class GoodSquare(GoodShape):
+    __slots__ = ('_side',)
+    
     def __init__(self, side):
         self._side = side
     
     def area(self):
-        return self._side ** 2
+        side = self._side
+        return side * side
 
 # Using LSP
 print("\n✅ Good design with LSP:")
@@ -364,6 +468,11 @@ class PaymentProcessor(ABC):
     @abstractmethod
     def process_payment(self, amount):
         pass
+    
+    def process_payments(self, amounts):
+        """Charge a batch of amounts as one combined payment"""
+        total = float(np.sum(amounts)) if np is not None else sum(amounts)
+        return self.process_payment(total)
 
 class NotificationService(ABC):
     @abstractmethod
@@ -380,13 +489,16 @@ class EmailNotification(NotificationService):
         return f"📧 Email: {message}"
 
 # Single Responsibility
+@dataclass(slots=True)
 class Order:
     """Only handles order data"""
     
-    def __init__(self, order_id, items, total):
-        self.order_id = order_id
-        self.items = items
-        self.total = total
+    order_id: str
+    items: tuple
+    total: float
+    
+    def __post_init__(self):
+        self.items = tuple(self.items)
 
 class OrderProcessor:
     """Handles order processing logic"""
@@ -409,6 +521,24 @@ class OrderProcessor:
         print(f"  {notification}")
         
         return True
+    
+    def process_orders(self, orders: List[Order]):
+        """Process a batch of orders with one payment call and one notification"""
+        if np is not None:
+            totals = np.fromiter((order.total for order in orders),
+                                 dtype=np.float64, count=len(orders))
+        else:
+            totals = [order.total for order in orders]
+        payment_result = self.payment_processor.process_payments(totals)
+        print(f"  {payment_result}")
+        
+        order_ids = ', '.join(f"#{order.order_id}" for order in orders)
+        notification = self.notification_service.send(
+            f"Orders {order_ids} processed successfully"
+        )
+        print(f"  {notification}")
+        
+        return True
 
 # Using the system
 print("\nProcessing orders:")
@@ -421,6 +551,14 @@ processor = OrderProcessor(
 
 processor.process_order(order)
 
+print("\nProcessing a batch of orders:")
+batch = [
+    Order("ORD-002", ["Monitor"], 249.99),
+    Order("ORD-003", ["Keyboard", "Headset"], 159.98),
+    Order("ORD-004", ["Webcam"], 89.99)
+]
+processor.process_orders(batch)
+
 
 # ===== SUMMARY =====
 print("\n" + "=" * 60)
@@ -9,6 +9,84 @@ from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 import seaborn as sns
 
+try:
+    import numexpr as ne  # Optional: fused, multithreaded array expressions
+except ImportError:
+    ne = None
+
+try:
+    import polars as pl  # Optional: lazy, multithreaded engine for sales aggregations
+except ImportError:
+    pl = None
+
+try:
+    from numba import njit  # Optional: compiled kernels and pandas engine='numba'
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    def njit(*args, **kwargs):
+        """Numba not installed: leave the function as plain Python"""
+        return lambda func: func
+
+NS_PER_YEAR = 365.0 * 86400e9
+NUMBA_ENGINE_KWARGS = {'nopython': True, 'nogil': True, 'parallel': True}
+# pandas compiles its numba groupby kernels in every new process (seconds of
+# JIT); below this many rows the plain cython aggregations are faster
+NUMBA_GROUPBY_MIN_ROWS = 1_000_000
+
+@njit(cache=True, nogil=True)
+def _move_mean(values, window):
+    """Trailing mean over `window` values; NaN until the window has no gaps"""
+    out = np.empty(values.shape[0], dtype=np.float64)
+    total = 0.0
+    nobs = 0
+    for i in range(values.shape[0]):
+        x = values[i]
+        if not np.isnan(x):
+            total += x
+            nobs += 1
+        if i >= window:
+            old = values[i - window]
+            if not np.isnan(old):
+                total -= old
+                nobs -= 1
+        out[i] = total / nobs if nobs >= window else np.nan
+    return out
+
+def moving_average(series, window):
+    """series.rolling(window).mean(), as one O(n) numba pass when available"""
+    if not HAS_NUMBA:
+        return series.rolling(window=window).mean()
+    values = series.to_numpy(dtype=np.float64)
+    return pd.Series(_move_mean(values, window), index=series.index, name=series.name)
+
+def random_categorical(rng, categories, n):
+    """Random Categorical column built from int8 codes instead of an object array"""
+    codes = rng.integers(0, len(categories), n, dtype=np.int8)
+    return pd.Categorical.from_codes(codes, categories=categories)
+
+def grouped_agg(grouped, spec, use_numba=False):
+    """
+    Same result as grouped.agg(spec). With use_numba (and numba installed),
+    frames of at least NUMBA_GROUPBY_MIN_ROWS rows run each reduction as a
+    JIT-compiled numba kernel instead
+    """
+    if not (use_numba and HAS_NUMBA and len(grouped.obj) >= NUMBA_GROUPBY_MIN_ROWS):
+        return grouped.agg(spec)
+    
+    flat = all(isinstance(funcs, str) for funcs in spec.values())
+    columns = {}
+    for col, funcs in spec.items():
+        for func in ([funcs] if isinstance(funcs, str) else funcs):
+            if func == 'count':
+                result = grouped[col].count()
+            else:
+                result = getattr(grouped[col], func)(
+                    engine='numba', engine_kwargs=NUMBA_ENGINE_KWARGS
+                )
+            columns[col if flat else (col, func)] = result
+    return pd.DataFrame(columns)
+
 # Set display options
 pd.set_option('display.max_columns', None)
 pd.set_option('display.width', None)
@@ -17,11 +95,37 @@ class DataAnalyzer:
     """
     Comprehensive data analysis examples using Python
     Covers: Pandas, NumPy, data cleaning, aggregation, visualization
+    
+    engine='polars' runs the sales aggregations and time series through a
+    Polars LazyFrame instead of pandas. numba_groupby=True lets large frames
+    use pandas' numba groupby engine (see grouped_agg)
     """
     
-    def __init__(self):
+    def __init__(self, engine='pandas', numba_groupby=False):
+        if engine not in ('pandas', 'polars'):
+            raise ValueError(f"Unknown engine: {engine!r}")
+        if engine == 'polars' and pl is None:
+            raise ImportError("engine='polars' requires the polars package")
+        self.engine = engine
+        self.numba_groupby = numba_groupby
         self.employee_data = None
         self.sales_data = None
+        self._sales_lf = None
+    
+    def sales_lazy(self):
+        """
+        Sales data as a Polars LazyFrame, converted from pandas once.
+        Categorical columns become Enums with the same category order, so
+        grouped output sorts like the pandas path
+        """
+        if self._sales_lf is None:
+            enums = {
+                col: pl.Enum(dtype.categories.tolist())
+                for col, dtype in self.sales_data.dtypes.items()
+                if isinstance(dtype, pd.CategoricalDtype)
+            }
+            self._sales_lf = pl.from_pandas(self.sales_data).cast(enums).lazy()
+        return self._sales_lf
     
     def create_sample_data(self):
         """
@@ -33,35 +137,50 @@ class DataAnalyzer:
         print("=" * 60)
         
         # Employee dataset
-        np.random.seed(42)
+        # One PCG64 generator for every draw
+        rng = np.random.default_rng(42)
         n_employees = 100
         
         departments = ['IT', 'HR', 'Finance', 'Marketing', 'Operations']
+        products = ['Product A', 'Product B', 'Product C', 'Product D']
+        regions = ['North', 'South', 'East', 'West']
         
         self.employee_data = pd.DataFrame({
             'EmployeeID': range(1, n_employees + 1),
             'FirstName': [f'Employee{i}' for i in range(1, n_employees + 1)],
-            'Department': np.random.choice(departments, n_employees),
-            'Salary': np.random.randint(50000, 150000, n_employees),
-            'YearsExperience': np.random.randint(0, 20, n_employees),
-            'PerformanceScore': np.random.uniform(3.0, 5.0, n_employees),
+            'Department': random_categorical(rng, departments, n_employees),
+            'Salary': rng.integers(50000, 150000, n_employees, dtype=np.int32),
+            'YearsExperience': rng.integers(0, 20, n_employees, dtype=np.int8),
+            'PerformanceScore': 3.0 + 2.0 * rng.random(n_employees, dtype=np.float32),
             'HireDate': pd.date_range(end=datetime.now(), periods=n_employees, freq='D')
         })
         
-        # Sales dataset
-        date_range = pd.date_range(start='2024-01-01', end='2024-12-31', freq='D')
-        n_sales = len(date_range) * 10
+        # Sales dataset: whole days in 2024, drawn as day offsets so the
+        # column stays a native datetime64[ns] buffer
+        start = np.datetime64('2024-01-01', 'D')
+        n_days = int((np.datetime64('2024-12-31', 'D') - start) // np.timedelta64(1, 'D')) + 1
+        n_sales = n_days * 10
+        
+        dates = (start + rng.integers(0, n_days, n_sales)).astype('datetime64[ns]')
+        quantity = rng.integers(1, 50, n_sales, dtype=np.int32)
+        unit_price = rng.uniform(10, 500, n_sales)
+        total_amount = np.empty(n_sales, dtype=np.float64)
+        if ne is not None:
+            ne.evaluate('quantity * unit_price', out=total_amount)
+        else:
+            np.multiply(quantity, unit_price, out=total_amount)
         
         self.sales_data = pd.DataFrame({
             'SaleID': range(1, n_sales + 1),
-            'Date': np.random.choice(date_range, n_sales),
-            'Product': np.random.choice(['Product A', 'Product B', 'Product C', 'Product D'], n_sales),
-            'Quantity': np.random.randint(1, 50, n_sales),
-            'UnitPrice': np.random.uniform(10, 500, n_sales),
-            'Region': np.random.choice(['North', 'South', 'East', 'West'], n_sales)
+            'Date': dates,
+            'Product': random_categorical(rng, products, n_sales),
+            'Quantity': quantity,
+            'UnitPrice': unit_price,
+            'Region': random_categorical(rng, regions, n_sales),
+            'TotalAmount': total_amount
         })
         
-        self.sales_data['TotalAmount'] = self.sales_data['Quantity'] * self.sales_data['UnitPrice']
+        self._sales_lf = None
         
         print(f"✓ Created employee dataset with {len(self.employee_data)} records")
         print(f"✓ Created sales dataset with {len(self.sales_data)} records\n")
@@ -119,41 +238,52 @@ class DataAnalyzer:
     def data_aggregation_grouping(self):
         """
         Data aggregation and grouping operations
-        Demonstrates: groupby, agg, pivot_table
+        Demonstrates: groupby, agg, unstack (pivot)
         """
         print("\n" + "=" * 60)
         print("3. DATA AGGREGATION AND GROUPING")
         print("=" * 60)
         
         # Group by department
-        dept_stats = self.employee_data.groupby('Department').agg({
+        dept_stats = grouped_agg(self.employee_data.groupby('Department', observed=True), {
             'Salary': ['mean', 'min', 'max', 'count'],
             'YearsExperience': 'mean',
             'PerformanceScore': 'mean'
-        }).round(2)
+        }, use_numba=self.numba_groupby).round(2)
         
         print("\nDepartment Statistics:")
         print(dept_stats)
         
         # Sales analysis by product and region
-        sales_summary = self.sales_data.groupby(['Product', 'Region']).agg({
-            'TotalAmount': 'sum',
-            'Quantity': 'sum',
-            'SaleID': 'count'
-        }).round(2)
+        if self.engine == 'polars':
+            sales_summary = (
+                self.sales_lazy()
+                .group_by(['Product', 'Region'])
+                .agg(
+                    pl.col('TotalAmount').sum().round(2),
+                    pl.col('Quantity').sum(),
+                    pl.col('SaleID').count()
+                )
+                .sort(['Product', 'Region'])
+                .collect()
+            )
+        else:
+            sales_summary = grouped_agg(self.sales_data.groupby(['Product', 'Region'], observed=True), {
+                'TotalAmount': 'sum',
+                'Quantity': 'sum',
+                'SaleID': 'count'
+            }, use_numba=self.numba_groupby).round(2)
         
         print("\n\nSales Summary by Product and Region:")
         print(sales_summary.head(10))
         
-        # Pivot table
-        sales_pivot = pd.pivot_table(
-            self.sales_data,
-            values='TotalAmount',
-            index='Product',
-            columns='Region',
-            aggfunc='sum',
-            fill_value=0
-        ).round(2)
+        # Pivot table (groupby + unstack on the categorical keys)
+        sales_pivot = (
+            self.sales_data.groupby(['Product', 'Region'], observed=True)['TotalAmount']
+            .sum()
+            .unstack('Region', fill_value=0)
+            .round(2)
+        )
         
         print("\n\nSales Pivot Table (Product x Region):")
         print(sales_pivot)
@@ -161,27 +291,28 @@ class DataAnalyzer:
     def data_transformation(self):
         """
         Data transformation and feature engineering
-        Demonstrates: apply, map, lambda, creating new columns
+        Demonstrates: pd.cut binning, creating new columns
         """
         print("\n" + "=" * 60)
         print("4. DATA TRANSFORMATION")
         print("=" * 60)
         
-        # Create salary brackets
-        def salary_bracket(salary):
-            if salary < 70000:
-                return 'Entry Level'
-            elif salary < 100000:
-                return 'Mid Level'
-            else:
-                return 'Senior Level'
-        
-        self.employee_data['SalaryBracket'] = self.employee_data['Salary'].apply(salary_bracket)
+        # Create salary brackets (right=False keeps 70000 -> Mid, 100000 -> Senior)
+        self.employee_data['SalaryBracket'] = pd.cut(
+            self.employee_data['Salary'],
+            bins=[-np.inf, 70000, 100000, np.inf],
+            labels=['Entry Level', 'Mid Level', 'Senior Level'],
+            right=False
+        )
         
-        # Calculate tenure in years
-        self.employee_data['TenureYears'] = (
-            (datetime.now() - self.employee_data['HireDate']).dt.days / 365
-        ).round(2)
+        # Calculate tenure in years on raw int64 nanoseconds (one fused pass with NumExpr)
+        hire_ns = self.employee_data['HireDate'].to_numpy('datetime64[ns]').view('i8')
+        now_ns = np.int64(pd.Timestamp.now().value)
+        if ne is not None:
+            tenure = ne.evaluate('(now_ns - hire_ns) / NS_PER_YEAR')
+        else:
+            tenure = (now_ns - hire_ns) / NS_PER_YEAR
+        self.employee_data['TenureYears'] = np.round(tenure, 2, out=tenure)
         
         # Performance category
         self.employee_data['PerformanceCategory'] = pd.cut(
@@ -206,25 +337,51 @@ class DataAnalyzer:
         print("5. TIME SERIES ANALYSIS")
         print("=" * 60)
         
-        # Set date as index
-        sales_ts = self.sales_data.set_index('Date').sort_index()
+        if self.engine == 'polars':
+            self._time_series_polars()
+            return
+        
+        # Date-indexed series of amounts; only these two columns are sorted
+        sales_ts = (
+            self.sales_data[['Date', 'TotalAmount']]
+            .sort_values('Date', kind='stable', ignore_index=True)
+            .set_index('Date')
+        )
         
-        # Daily sales aggregation
-        daily_sales = sales_ts.groupby('Date')['TotalAmount'].sum()
+        # Daily sales aggregation (hash groupby, then sort the ~365 day groups)
+        daily_sales = self.sales_data.groupby('Date', sort=False)['TotalAmount'].sum().sort_index()
         
-        # Monthly aggregation
-        monthly_sales = sales_ts.resample('M')['TotalAmount'].sum()
+        # Monthly aggregation: one resample pass yields every monthly statistic
+        sales_by_month = sales_ts['TotalAmount'].resample('ME').agg(['sum', 'mean', 'count'])
+        monthly_sales = sales_by_month['sum']
         print("\nMonthly Sales:")
         print(monthly_sales.head())
         
         # 7-day moving average
-        sales_ts['7Day_MA'] = sales_ts['TotalAmount'].rolling(window=7).mean()
+        sales_ts['7Day_MA'] = moving_average(sales_ts['TotalAmount'], 7)
         
-        # Year-over-year comparison (if multi-year data)
-        sales_by_month = sales_ts.resample('M').agg({
-            'TotalAmount': ['sum', 'mean', 'count']
-        })
+        print("\n\nMonthly Sales Summary:")
+        print(sales_by_month.head())
+        
+    def _time_series_polars(self):
+        """time_series_analysis as one lazy Polars plan (both outputs collected together)"""
+        sales_ts = self.sales_lazy().select('Date', 'TotalAmount').sort('Date')
+        amount = pl.col('TotalAmount')
+        
+        # Monthly aggregation (windows are labelled by month start)
+        sales_by_month = sales_ts.group_by_dynamic('Date', every='1mo').agg(
+            amount.sum().alias('sum'),
+            amount.mean().alias('mean'),
+            amount.count().alias('count')
+        )
         
+        # 7-sale moving average, matching the pandas row window
+        moving_avg = sales_ts.with_columns(amount.rolling_mean(window_size=7).alias('7Day_MA'))
+        
+        sales_by_month, moving_avg = pl.collect_all([sales_by_month, moving_avg])
+        
+        print("\nMonthly Sales:")
+        print(sales_by_month.select('Date', 'sum').head())
         print("\n\nMonthly Sales Summary:")
         print(sales_by_month.head())
         
@@ -239,22 +396,37 @@ class DataAnalyzer:
         
         # Correlation analysis
         numeric_cols = ['Salary', 'YearsExperience', 'PerformanceScore']
-        correlation_matrix = self.employee_data[numeric_cols].corr()
+        numeric = np.ascontiguousarray(
+            self.employee_data[numeric_cols].to_numpy(dtype=np.float64)
+        )
+        correlation_matrix = pd.DataFrame(
+            np.corrcoef(numeric, rowvar=False), index=numeric_cols, columns=numeric_cols
+        )
         
         print("\nCorrelation Matrix:")
         print(correlation_matrix.round(3))
         
-        # Percentile analysis
-        salary_percentiles = self.employee_data['Salary'].quantile([0.25, 0.5, 0.75, 0.9])
+        # One stable descending sort of salaries serves both the percentiles
+        # and the top 10 (ties keep row order, as nlargest does)
+        salaries = self.employee_data['Salary'].to_numpy()
+        order = np.argsort(-salaries, kind='stable')
+        ascending = salaries[order[::-1]]
+        
+        # Percentile analysis (linear interpolation, same as Series.quantile)
+        quantiles = np.array([0.25, 0.5, 0.75, 0.9])
+        pos = quantiles * (len(ascending) - 1)
+        lo = pos.astype(np.intp)
+        hi = np.minimum(lo + 1, len(ascending) - 1)
+        salary_percentiles = pd.Series(
+            ascending[lo] + (ascending[hi] - ascending[lo]) * (pos - lo),
+            index=quantiles, name='Salary'
+        )
         print("\n\nSalary Percentiles:")
         print(salary_percentiles)
         
-        # Ranking
-        self.employee_data['SalaryRank'] = self.employee_data['Salary'].rank(ascending=False)
-        self.employee_data['PerformanceRank'] = self.employee_data['PerformanceScore'].rank(ascending=False)
-        
-        top_10 = self.employee_data.nsmallest(10, 'SalaryRank')[
-            ['EmployeeID', 'Department', 'Salary', 'SalaryRank', 'PerformanceScore']
+        # Ranking: the first 10 positions of the same sort
+        top_10 = self.employee_data.iloc[order[:10]][
+            ['EmployeeID', 'Department', 'Salary', 'PerformanceScore']
         ]
         print("\n\nTop 10 Highest Paid Employees:")
         print(top_10)
@@ -268,8 +440,12 @@ class DataAnalyzer:
         print("7. DATA QUALITY CHECKS")
         print("=" * 60)
         
-        # Check for missing values
-        missing_values = self.employee_data.isnull().sum()
+        # Check for missing values; NumPy int/uint/bool columns cannot hold NaN
+        missing_values = pd.Series({
+            col: 0 if isinstance(series.dtype, np.dtype) and series.dtype.kind in 'iub'
+            else int(series.isna().sum())
+            for col, series in self.employee_data.items()
+        })
         print("\nMissing Values:")
         print(missing_values)
         
@@ -278,14 +454,13 @@ class DataAnalyzer:
         print(f"\n✓ Duplicate rows: {duplicates}")
         
         # Data validation
-        invalid_salaries = self.employee_data[self.employee_data['Salary'] < 0]
-        print(f"✓ Invalid salaries (< 0): {len(invalid_salaries)}")
+        salaries = self.employee_data['Salary'].to_numpy()
+        invalid_salaries = np.count_nonzero(salaries < 0)
+        print(f"✓ Invalid salaries (< 0): {invalid_salaries}")
         
-        invalid_scores = self.employee_data[
-            (self.employee_data['PerformanceScore'] < 0) | 
-            (self.employee_data['PerformanceScore'] > 5)
-        ]
-        print(f"✓ Invalid performance scores: {len(invalid_scores)}")
+        scores = self.employee_data['PerformanceScore'].to_numpy()
+        invalid_scores = np.count_nonzero((scores < 0) | (scores > 5))
+        print(f"✓ Invalid performance scores: {invalid_scores}")
         
         # Data type validation
         print(f"\n✓ All data types are correct: {self.employee_data.dtypes.to_dict()}")
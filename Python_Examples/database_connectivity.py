@@ -6,6 +6,38 @@ Demonstrates: SQL Server connection, CRUD operations, pandas integration
 import pyodbc
 import pandas as pd
 from datetime import datetime
+from decimal import Decimal
+from functools import lru_cache
+from uuid import UUID
+
+try:
+    import pyarrow as pa  # Optional: columnar result sets
+except ImportError:
+    pa = None
+
+# Rows pulled per fetchmany() call when streaming a result set
+FETCH_BATCH_SIZE = 10_000
+# Rows inserted per transaction by bulk_insert_from_dataframe
+BULK_COMMIT_ROWS = 50_000
+
+def _arrow_type(column):
+    """
+    Arrow type for a cursor.description entry. DECIMAL columns get their
+    declared precision and scale so every batch agrees; UNIQUEIDENTIFIER
+    columns are strings (_fetch_dataframe converts the UUIDs); None lets
+    Arrow infer
+    """
+    type_code, precision, scale = column[1], column[4], column[5]
+    if type_code is Decimal:
+        return pa.decimal128(precision, scale)
+    if type_code is UUID:
+        return pa.string()
+    return None
+
+@lru_cache(maxsize=128)
+def _call_sql(proc_name, arity):
+    """ODBC call escape for a procedure taking `arity` parameters, built once"""
+    return f"{{CALL {proc_name}({','.join('?' * arity)})}}"
 
 class DatabaseConnector:
     """
@@ -28,11 +60,16 @@ class DatabaseConnector:
             pass
         
         self.connection = None
+        self._cursor = None
     
     def connect(self):
         """Establish database connection"""
         try:
-            self.connection = pyodbc.connect(self.connection_string)
+            # Explicit transactions; commits are issued by the methods below
+            self.connection = pyodbc.connect(self.connection_string, autocommit=False)
+            # One cursor for the whole session: re-running the same SQL on it
+            # reuses the driver's prepared statement handle
+            self._cursor = self.connection.cursor()
             print("✓ Database connection established successfully!")
             return True
         except Exception as e:
@@ -41,32 +78,57 @@ class DatabaseConnector:
     
     def disconnect(self):
         """Close database connection"""
+        if self._cursor:
+            self._cursor.close()
+            self._cursor = None
         if self.connection:
             self.connection.close()
             print("✓ Database connection closed")
     
+    def _fetch_dataframe(self, cursor):
+        """
+        Read the current result set into a DataFrame
+        Streams fetchmany() batches into Arrow columns when pyarrow is available
+        """
+        columns = [column[0] for column in cursor.description]
+        if pa is None:
+            return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+        
+        types = [_arrow_type(column) for column in cursor.description]
+        type_codes = [column[1] for column in cursor.description]
+        tables = []
+        while True:
+            rows = cursor.fetchmany(FETCH_BATCH_SIZE)
+            if not rows:
+                break
+            arrays = [
+                pa.array([None if v is None else str(v) for v in values]
+                         if type_code is UUID else values, type=arrow_type)
+                for values, arrow_type, type_code in zip(zip(*rows), types, type_codes)
+            ]
+            tables.append(pa.table(arrays, names=columns))
+        
+        if not tables:
+            return pd.DataFrame(columns=columns)
+        # promote_options lets an all-NULL batch column merge with a typed one
+        table = pa.concat_tables(tables, promote_options='default')
+        return table.to_pandas(types_mapper=pd.ArrowDtype)
+    
     def execute_query(self, query, params=None):
         """
         Execute a SELECT query and return results as DataFrame
         Demonstrates: Cursor operations, parameterized queries
         """
         try:
-            cursor = self.connection.cursor()
+            cursor = self._cursor
             
             if params:
                 cursor.execute(query, params)
             else:
                 cursor.execute(query)
             
-            # Fetch all results
-            columns = [column[0] for column in cursor.description]
-            results = cursor.fetchall()
-            
-            # Convert to DataFrame
-            df = pd.DataFrame.from_records(results, columns=columns)
-            
-            cursor.close()
-            return df
+            # Fetch results in batches into a DataFrame
+            return self._fetch_dataframe(cursor)
         
         except Exception as e:
             print(f"Query execution error: {e}")
@@ -78,7 +140,7 @@ class DatabaseConnector:
         Demonstrates: Data modification, transactions
         """
         try:
-            cursor = self.connection.cursor()
+            cursor = self._cursor
             
             if params:
                 cursor.execute(query, params)
@@ -86,10 +148,7 @@ class DatabaseConnector:
                 cursor.execute(query)
             
             self.connection.commit()
-            rows_affected = cursor.rowcount
-            
-            cursor.close()
-            return rows_affected
+            return cursor.rowcount
         
         except Exception as e:
             self.connection.rollback()
@@ -102,23 +161,18 @@ class DatabaseConnector:
         Demonstrates: Stored procedure execution
         """
         try:
-            cursor = self.connection.cursor()
+            cursor = self._cursor
             
+            # {CALL ...} lets the driver bind the parameters natively
             if params:
-                cursor.execute(f"EXEC {proc_name} {','.join(['?'] * len(params))}", params)
+                cursor.execute(_call_sql(proc_name, len(params)), params)
             else:
-                cursor.execute(f"EXEC {proc_name}")
+                cursor.execute(_call_sql(proc_name, 0))
             
             # Fetch results if any
             if cursor.description:
-                columns = [column[0] for column in cursor.description]
-                results = cursor.fetchall()
-                df = pd.DataFrame.from_records(results, columns=columns)
-                cursor.close()
-                return df
-            else:
-                cursor.close()
-                return None
+                return self._fetch_dataframe(cursor)
+            return None
         
         except Exception as e:
             print(f"Stored procedure error: {e}")
@@ -129,29 +183,41 @@ class DatabaseConnector:
         Bulk insert data from a pandas DataFrame
         Demonstrates: Efficient data loading
         """
+        inserted = 0
         try:
             cursor = self.connection.cursor()
+            # Bind all rows as one parameter array instead of one round-trip per row
+            cursor.fast_executemany = True
             
             # Create INSERT statement
             columns = ', '.join(df.columns)
             placeholders = ', '.join(['?'] * len(df.columns))
             insert_query = f"INSERT INTO {table_name} ({columns}) VALUES ({placeholders})"
             
-            # Convert DataFrame to list of tuples
-            data = [tuple(row) for row in df.values]
+            # Microsecond datetimes bind natively as DATETIME2
+            datetime_cols = df.select_dtypes(include=['datetime64']).columns
+            if len(datetime_cols):
+                df = df.astype({col: 'datetime64[us]' for col in datetime_cols})
             
-            # Execute batch insert
-            cursor.executemany(insert_query, data)
-            self.connection.commit()
+            # Execute batch insert, committing every BULK_COMMIT_ROWS rows so
+            # the transaction log and the parameter array stay bounded
+            for start in range(0, len(df), BULK_COMMIT_ROWS):
+                chunk = df.iloc[start:start + BULK_COMMIT_ROWS]
+                # Each column converts to Python values in one C-level tolist();
+                # zip assembles the row tuples pyodbc needs without a per-row loop
+                data = list(zip(*(chunk[col].tolist() for col in chunk.columns)))
+                cursor.executemany(insert_query, data)
+                self.connection.commit()
+                inserted += len(data)
             
-            print(f"✓ Inserted {len(data)} rows into {table_name}")
+            print(f"✓ Inserted {inserted} rows into {table_name}")
             cursor.close()
-            return len(data)
+            return inserted
         
         except Exception as e:
             self.connection.rollback()
-            print(f"Bulk insert error: {e}")
-            return 0
+            print(f"Bulk insert error after {inserted} committed rows: {e}")
+            return inserted
 
 # Example usage
 def demonstrate_database_operations():